@@ -0,0 +1,465 @@
+import asyncio
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Katalog główny repozytorium, aby zaimportować solvery z pozostałych projektów
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linear_equations_solver.main import gaussian_elimination
+from nonlinear_equations_solver.main import (
+    bisection_method,
+    secant_method,
+    get_example_functions,
+    create_polynomial_function,
+    apply_trigonometric,
+    apply_exponential,
+    apply_composite_function,
+)
+from newton_interpolation.main import newton_interpolation
+
+JOB_TYPES = ('linear', 'root', 'interpolation')
+ROOT_METHODS = {'bisection': bisection_method, 'secant': secant_method}
+MAX_BODY_SIZE = 10 * 1024 * 1024
+MAX_ITERATIONS = 1000000
+
+def build_function(spec):
+    if isinstance(spec, list):
+        functions = [build_function(s) for s in spec]
+        return lambda x: apply_composite_function(x, functions)
+
+    if 'example' in spec:
+        index = int(spec['example'])
+        functions = get_example_functions()
+        if index < 1 or index > len(functions):
+            raise ValueError(f"Nieprawidłowy numer funkcji przykładowej: {index}")
+        return functions[index - 1]
+    if 'polynomial' in spec:
+        return create_polynomial_function([float(c) for c in spec['polynomial']])
+    if 'trigonometric' in spec:
+        p = spec['trigonometric']
+        return lambda x: apply_trigonometric(x, int(p['type']), float(p['a']), float(p['b']),
+                                             float(p['c']), float(p['d']))
+    if 'exponential' in spec:
+        p = spec['exponential']
+        base = float(p['p']) if 'p' in p else None
+        return lambda x: apply_exponential(x, int(p['type']), float(p['a']), float(p['b']),
+                                           float(p['c']), base)
+    raise ValueError("Nieznany opis funkcji")
+
+def run_linear_job(job):
+    A = np.array(job['A'], dtype=float)
+    b = np.array(job['b'], dtype=float)
+    if A.ndim != 2 or A.shape[0] != A.shape[1] or A.shape[0] != len(b):
+        raise ValueError("Macierz A musi być kwadratowa i zgodna z wektorem b")
+    solution, error = gaussian_elimination(A, b)
+    if error:
+        raise ValueError(error)
+    return {'x': [float(v) for v in solution]}
+
+def run_root_job(job):
+    method = job.get('method', 'bisection')
+    if method not in ROOT_METHODS:
+        raise ValueError(f"Nieznana metoda: {method}")
+    f = build_function(job['function'])
+    use_epsilon_condition = bool(job.get('use_epsilon_condition', True))
+    epsilon = float(job.get('epsilon', 1e-10))
+    iterations = int(job.get('iterations', 1000))
+    safe_evaluation = bool(job.get('safe_evaluation', False))
+    root, iters = ROOT_METHODS[method](f, float(job['a']), float(job['b']), epsilon,
+                                       iterations, use_epsilon_condition, safe_evaluation)
+    if root is None:
+        raise ValueError("Nie udało się znaleźć pierwiastka")
+    return {'root': float(root), 'iterations': iters}
+
+def run_interpolation_job(job):
+    x = [float(v) for v in job['x']]
+    y = [float(v) for v in job['y']]
+    if len(x) != len(y) or not x:
+        raise ValueError("Wektory x i y muszą być niepuste i tej samej długości")
+    if len(set(x)) != len(x):
+        raise ValueError("Węzły interpolacji muszą być różne")
+    x_eval = job['x_eval']
+    if isinstance(x_eval, list):
+        return {'y': [float(newton_interpolation(x, y, float(xi))) for xi in x_eval]}
+    return {'y': float(newton_interpolation(x, y, float(x_eval)))}
+
+JOB_RUNNERS = {
+    'linear': run_linear_job,
+    'root': run_root_job,
+    'interpolation': run_interpolation_job,
+}
+
+def raise_job_timeout(signum, frame):
+    raise TimeoutError
+
+def run_job(job, deadline):
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        return {'status': 'timeout', 'error': "Przekroczono limit czasu przed uruchomieniem zadania"}
+
+    # Zegar SIGALRM przerywa zadanie po upływie limitu i zwalnia proces roboczy
+    use_alarm = hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, raise_job_timeout)
+        signal.setitimer(signal.ITIMER_REAL, remaining)
+    try:
+        return {'status': 'ok', 'result': JOB_RUNNERS[job['type']](job)}
+    except TimeoutError:
+        return {'status': 'timeout', 'error': "Przekroczono limit czasu"}
+    except Exception as e:
+        return {'status': 'error', 'error': str(e) or type(e).__name__}
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+def execute_job(job, deadline):
+    # Wykonywane w procesie roboczym
+    try:
+        return run_job(job, deadline)
+    except TimeoutError:
+        # Zegar zdążył zadziałać już po zakończeniu zadania
+        return {'status': 'timeout', 'error': "Przekroczono limit czasu"}
+
+def batch_key(item):
+    job = item[0]
+    if job['type'] == 'root':
+        return ('root', job.get('method', 'bisection'))
+    return (job['type'], '')
+
+def create_server_state(workers=None, queue_size=256, batch_size=16, batch_window=0.005,
+                        default_timeout=30.0):
+    workers = workers or os.cpu_count() or 1
+    return {
+        'queue': asyncio.Queue(maxsize=queue_size),
+        'pool': ProcessPoolExecutor(max_workers=workers),
+        'inflight': asyncio.Semaphore(2 * workers),
+        'batch_size': batch_size,
+        'batch_window': batch_window,
+        'default_timeout': default_timeout,
+        'next_id': 0,
+        'metrics': {
+            'started_at': time.monotonic(),
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'rejected': 0,
+            'batches': 0,
+            'latencies': deque(maxlen=10000),
+            'finished_at': deque(maxlen=100000),
+        },
+    }
+
+def record_result(state, result, submitted_at):
+    metrics = state['metrics']
+    now = time.monotonic()
+    if result['status'] == 'ok':
+        metrics['completed'] += 1
+    elif result['status'] == 'timeout':
+        metrics['timed_out'] += 1
+    else:
+        metrics['failed'] += 1
+    metrics['latencies'].append(now - submitted_at)
+    metrics['finished_at'].append(now)
+
+def get_metrics(state):
+    metrics = state['metrics']
+    now = time.monotonic()
+    uptime = now - metrics['started_at']
+    latencies = np.array(metrics['latencies'])
+    if len(latencies):
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        percentiles = {'p50': float(p50), 'p90': float(p90), 'p99': float(p99)}
+    else:
+        percentiles = {'p50': None, 'p90': None, 'p99': None}
+    recent = sum(1 for t in metrics['finished_at'] if now - t <= 60)
+    finished = metrics['completed'] + metrics['failed'] + metrics['timed_out']
+    return {
+        'queue_depth': state['queue'].qsize(),
+        'queue_capacity': state['queue'].maxsize,
+        'submitted': metrics['submitted'],
+        'completed': metrics['completed'],
+        'failed': metrics['failed'],
+        'timed_out': metrics['timed_out'],
+        'rejected': metrics['rejected'],
+        'batches': metrics['batches'],
+        'latency_seconds': percentiles,
+        'throughput_per_second': {
+            'overall': finished / uptime if uptime > 0 else 0.0,
+            'last_60s': recent / min(uptime, 60) if uptime > 0 else 0.0,
+        },
+        'uptime_seconds': uptime,
+    }
+
+async def collect_batch(state):
+    queue = state['queue']
+    batch = [await queue.get()]
+    deadline = time.monotonic() + state['batch_window']
+    while len(batch) < state['batch_size']:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), remaining))
+        except asyncio.TimeoutError:
+            break
+    # Zadania, na które klient już nie czeka (przekroczony czas), są pomijane
+    return [item for item in batch if not item[1].done()]
+
+async def run_single(state, job, deadline, future):
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(state['pool'], execute_job, job, deadline)
+    except Exception as e:
+        result = {'status': 'error', 'error': f"Błąd procesu roboczego: {e}"}
+    finally:
+        state['inflight'].release()
+    if not future.done():
+        future.set_result(result)
+
+async def dispatcher(state):
+    while True:
+        batch = await collect_batch(state)
+        state['metrics']['batches'] += 1
+        # Każde zadanie ma własną przyszłość w puli - zadania z paczki wykonują się równolegle
+        # i każdy wynik jest odsyłany od razu; zgodne zadania wysyłane są do puli kolejno
+        for job, future, deadline in sorted(batch, key=batch_key):
+            # Ograniczenie liczby zadań w puli - nadmiar zostaje w kolejce (backpressure)
+            await state['inflight'].acquire()
+            if future.done():
+                state['inflight'].release()
+                continue
+            asyncio.create_task(run_single(state, job, deadline, future))
+
+def validate_job(job):
+    if not isinstance(job, dict):
+        return "Zadanie musi być obiektem JSON"
+    if job.get('type') not in JOB_TYPES:
+        return f"Nieznany typ zadania: {job.get('type')}"
+
+    timeout = job.get('timeout')
+    if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float))
+                                or not np.isfinite(timeout) or timeout <= 0):
+        return "Limit czasu musi być dodatnią liczbą"
+
+    iterations = job.get('iterations')
+    if iterations is not None and (isinstance(iterations, bool) or not isinstance(iterations, int)
+                                   or iterations < 1 or iterations > MAX_ITERATIONS):
+        return f"Liczba iteracji musi być liczbą całkowitą z przedziału od 1 do {MAX_ITERATIONS}"
+    return None
+
+async def wait_for_job(state, job_id, future, timeout, submitted_at):
+    try:
+        result = await asyncio.wait_for(asyncio.shield(future), timeout)
+    except asyncio.TimeoutError:
+        future.cancel()
+        result = {'status': 'timeout', 'error': f"Przekroczono limit czasu ({timeout} s)"}
+    record_result(state, result, submitted_at)
+    return dict(result, id=job_id)
+
+def submit_jobs(state, jobs):
+    queue = state['queue']
+    if queue.maxsize - queue.qsize() < len(jobs):
+        state['metrics']['rejected'] += len(jobs)
+        return None
+
+    loop = asyncio.get_running_loop()
+    waiters = []
+    for job in jobs:
+        job_id = job.get('id') if isinstance(job, dict) else None
+        if job_id is None:
+            state['next_id'] += 1
+            job_id = state['next_id']
+        submitted_at = time.monotonic()
+        future = loop.create_future()
+        error = validate_job(job)
+        if error:
+            future.set_result({'status': 'error', 'error': error})
+            timeout = None
+        else:
+            timeout = float(job.get('timeout', state['default_timeout']))
+            queue.put_nowait((job, future, time.time() + timeout))
+        state['metrics']['submitted'] += 1
+        waiters.append(wait_for_job(state, job_id, future, timeout, submitted_at))
+    return waiters
+
+async def read_request(reader):
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    parts = request_line.decode('latin-1').split()
+    if len(parts) < 2:
+        raise ValueError("Nieprawidłowe żądanie HTTP")
+    method, path = parts[0].upper(), parts[1]
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get('content-length', 0))
+    if length > MAX_BODY_SIZE:
+        raise ValueError("Zbyt duże żądanie")
+    body = await reader.readexactly(length) if length else b''
+    return method, path, body
+
+async def send_response(writer, status, payload, extra_headers=None):
+    body = json.dumps(payload).encode()
+    headers = [
+        f"HTTP/1.1 {status}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        "Connection: close",
+    ] + (extra_headers or [])
+    writer.write(("\r\n".join(headers) + "\r\n\r\n").encode() + body)
+    await writer.drain()
+
+async def stream_results(writer, waiters):
+    # Wyniki odsyłane są jako NDJSON w kolejności ukończenia zadań
+    writer.write(("HTTP/1.1 200 OK\r\n"
+                  "Content-Type: application/x-ndjson\r\n"
+                  "Transfer-Encoding: chunked\r\n"
+                  "Connection: close\r\n\r\n").encode())
+    await writer.drain()
+    for next_result in asyncio.as_completed(waiters):
+        line = (json.dumps(await next_result) + "\n").encode()
+        writer.write(f"{len(line):X}\r\n".encode() + line + b"\r\n")
+        await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+async def handle_connection(state, reader, writer):
+    try:
+        try:
+            request = await read_request(reader)
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            await send_response(writer, "400 Bad Request", {'error': str(e)})
+            return
+        if request is None:
+            return
+        method, path, body = request
+
+        if method == 'GET' and path == '/metrics':
+            await send_response(writer, "200 OK", get_metrics(state))
+        elif method == 'POST' and path == '/jobs':
+            try:
+                payload = json.loads(body or b'null')
+            except ValueError:
+                await send_response(writer, "400 Bad Request", {'error': "Nieprawidłowy JSON"})
+                return
+            if isinstance(payload, dict) and 'jobs' in payload:
+                payload = payload['jobs']
+            jobs = payload if isinstance(payload, list) else [payload]
+
+            if len(jobs) > state['queue'].maxsize:
+                # Ponowienie nic nie da - żądanie nigdy nie zmieści się w kolejce
+                state['metrics']['rejected'] += len(jobs)
+                await send_response(writer, "413 Payload Too Large",
+                                    {'error': f"Zbyt wiele zadań w jednym żądaniu "
+                                              f"(maksymalnie {state['queue'].maxsize})"})
+                return
+
+            waiters = submit_jobs(state, jobs)
+            if waiters is None:
+                await send_response(writer, "503 Service Unavailable",
+                                    {'error': "Kolejka zadań jest pełna"}, ["Retry-After: 1"])
+                return
+            await stream_results(writer, waiters)
+        else:
+            await send_response(writer, "404 Not Found", {'error': "Nieznany zasób"})
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+async def start_server(state, host='127.0.0.1', port=8765, unix_path=None):
+    state['dispatcher'] = asyncio.create_task(dispatcher(state))
+    handler = lambda reader, writer: handle_connection(state, reader, writer)
+    if unix_path:
+        return await asyncio.start_unix_server(handler, path=unix_path)
+    return await asyncio.start_server(handler, host, port)
+
+async def stop_server(state, server):
+    server.close()
+    await server.wait_closed()
+    state['dispatcher'].cancel()
+    state['pool'].shutdown(wait=False, cancel_futures=True)
+
+async def send_jobs(jobs, host='127.0.0.1', port=8765, unix_path=None):
+    # Prosty klient do testów lokalnych - zwraca status HTTP i listę wyników
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps({'jobs': jobs}).encode()
+    writer.write((f"POST /jobs HTTP/1.1\r\nHost: {host}\r\n"
+                  f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                  "Connection: close\r\n\r\n").encode() + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get('transfer-encoding') == 'chunked':
+        results = []
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            if size == 0:
+                break
+            results.append(json.loads(await reader.readexactly(size)))
+            await reader.readline()
+    else:
+        results = json.loads(await reader.read())
+    writer.close()
+    return status, results
+
+async def run(args):
+    state = create_server_state(args.workers, args.queue_size, args.batch_size,
+                                args.batch_window, args.timeout)
+    server = await start_server(state, args.host, args.port, args.unix)
+    where = args.unix if args.unix else f"http://{args.host}:{args.port}"
+    print(f"Serwer zadań nasłuchuje na {where}")
+    print("POST /jobs - przesłanie zadań, GET /metrics - statystyki")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stop_server(state, server)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serwer zadań dla solverów numerycznych")
+    parser.add_argument('--host', default='127.0.0.1', help="Adres nasłuchiwania")
+    parser.add_argument('--port', type=int, default=8765, help="Port nasłuchiwania")
+    parser.add_argument('--unix', default=None, help="Ścieżka gniazda Unix (zamiast TCP)")
+    parser.add_argument('--workers', type=int, default=None, help="Liczba procesów roboczych")
+    parser.add_argument('--queue-size', type=int, default=256, help="Maksymalna długość kolejki")
+    parser.add_argument('--batch-size', type=int, default=16, help="Maksymalny rozmiar paczki")
+    parser.add_argument('--batch-window', type=float, default=0.005,
+                        help="Czas zbierania paczki w sekundach")
+    parser.add_argument('--timeout', type=float, default=30.0,
+                        help="Domyślny limit czasu zadania w sekundach")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        print("\nDo widzenia!")
+
+if __name__ == "__main__":
+    main()
@@ -101,6 +101,43 @@ def gaussian_elimination(A, b):
     
     return x, None
 
+def lu_decomposition(A):
+    n = len(A)
+    LU = np.array(A, dtype=float)
+    perm = np.arange(n)
+
+    for i in range(n):
+        #Wybór elementu podstawowego
+        max_row = i + np.argmax(np.abs(LU[i:, i]))
+        if max_row != i:
+            LU[[i, max_row]] = LU[[max_row, i]]
+            perm[[i, max_row]] = perm[[max_row, i]]
+
+        if abs(LU[i, i]) < 1e-10:
+            return None, None, "Macierz jest osobliwa - rozkład LU nie istnieje"
+
+        #Mnożniki zapisywane pod przekątną, reszta wiersza to macierz U
+        LU[i+1:, i] /= LU[i, i]
+        LU[i+1:, i+1:] -= np.outer(LU[i+1:, i], LU[i, i+1:])
+
+    return LU, perm, None
+
+def lu_solve(LU, perm, b):
+    #b może być wektorem lub macierzą (wiele prawych stron naraz)
+    n = len(perm)
+    y = np.array(b, dtype=float)[perm]
+
+    #Podstawienie w przód (L ma jedynki na przekątnej)
+    for i in range(1, n):
+        y[i] -= np.dot(LU[i, :i], y[:i])
+
+    #Podstawienie wstecz
+    x = np.zeros_like(y)
+    for i in range(n-1, -1, -1):
+        x[i] = (y[i] - np.dot(LU[i, i+1:n], x[i+1:n])) / LU[i, i]
+
+    return x
+
 def solve_and_print_results(A, b, system_name=""):
     if system_name:
         print(f"\n{'='*50}")
@@ -1,14 +1,50 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def bisection_method(f, a, b, epsilon, iterations, use_epsilon_condition):
+def safe_evaluate(f, x):
+    # Najpierw zwykła precyzja, rozszerzona tylko gdy wynik wyszedł poza zakres
+    try:
+        with np.errstate(over='ignore', invalid='ignore'):
+            y = f(x)
+        if np.isfinite(y):
+            return y
+    except OverflowError:
+        pass
+    
+    try:
+        with np.errstate(over='ignore', invalid='ignore'):
+            y = f(np.longdouble(x))
+    except OverflowError:
+        raise OverflowError(f"Nie można obliczyć wartości funkcji w punkcie {x}")
+    
+    # Wartość ±inf niesie jeszcze informację o znaku, NaN już nie
+    if np.isnan(y):
+        raise OverflowError(f"Nie można obliczyć wartości funkcji w punkcie {x}")
+    return y
+
+def create_safe_function(f):
+    return lambda x: safe_evaluate(f, x)
+
+def is_out_of_scale(f_a, f_b, max_ratio=1e8):
+    # Wartości poza zakresem double albo różniące się o wiele rzędów wielkości
+    big = max(abs(f_a), abs(f_b))
+    small = min(abs(f_a), abs(f_b))
+    with np.errstate(over='ignore'):
+        if not np.isfinite(np.float64(big)):
+            return True
+    return big > 1 and big > max_ratio * small
+
+def bisection_method(f, a, b, epsilon, iterations, use_epsilon_condition, safe_evaluation=False):
+    if safe_evaluation:
+        f = create_safe_function(f)
+    
     try:
         fa = f(a)
         fb = f(b)
     except (ValueError, OverflowError):
         return None, 0
     
-    if fa * fb >= 0:
+    if np.sign(fa) * np.sign(fb) >= 0:
         return None, 0
     
     i = 0
@@ -27,7 +63,7 @@ def bisection_method(f, a, b, epsilon, iterations, use_epsilon_condition):
         if fc == 0 or abs(fc) < epsilon:
             return c, i + 1
         
-        if fa * fc < 0:
+        if np.sign(fa) * np.sign(fc) < 0:
             b = c
             fb = fc
         else:
@@ -39,7 +75,55 @@ def bisection_method(f, a, b, epsilon, iterations, use_epsilon_condition):
     
     return c, i
 
-def secant_method(f, a, b, epsilon, iterations, use_epsilon_condition):
+def safeguarded_secant(f, a, b, fa, fb, epsilon, iterations, use_epsilon_condition):
+    # Przedział [lo, hi] przez cały czas zawiera zmianę znaku funkcji
+    lo, f_lo, hi = (a, fa, b) if a < b else (b, fb, a)
+    x_prev, f_prev = a, fa
+    x_curr, f_curr = b, fb
+    widths = [np.inf, np.inf]
+    
+    for i in range(iterations):
+        x_next = None
+        denominator = f_curr - f_prev
+        if not is_out_of_scale(f_prev, f_curr) and denominator != 0:
+            x_next = x_curr - f_curr * (x_curr - x_prev) / denominator
+        
+        # Krok bisekcji, gdy sieczna wychodzi poza przedział albo przedział maleje zbyt wolno
+        if x_next is None or not lo < x_next < hi or hi - lo > widths[-2] / 2:
+            x_next = (lo + hi) / 2
+            if not lo < x_next < hi:
+                # Przedział osiągnął rozdzielczość arytmetyki zmiennoprzecinkowej
+                return x_next, i
+        
+        try:
+            f_next = f(x_next)
+        except (ValueError, OverflowError):
+            return None, i
+        
+        if use_epsilon_condition and abs(x_next - x_curr) < epsilon:
+            return x_next, i + 1
+        
+        if abs(f_next) < epsilon:
+            return x_next, i + 1
+        
+        if np.sign(f_next) == np.sign(f_lo):
+            lo, f_lo = x_next, f_next
+        else:
+            hi = x_next
+        
+        if use_epsilon_condition and hi - lo < epsilon:
+            return x_next, i + 1
+        
+        widths.append(hi - lo)
+        x_prev, f_prev = x_curr, f_curr
+        x_curr, f_curr = x_next, f_next
+    
+    return x_curr, iterations
+
+def secant_method(f, a, b, epsilon, iterations, use_epsilon_condition, safe_evaluation=False):
+    if safe_evaluation:
+        f = create_safe_function(f)
+    
     i = 0
     x_prev = a
     x_curr = b
@@ -50,7 +134,33 @@ def secant_method(f, a, b, epsilon, iterations, use_epsilon_condition):
     except (ValueError, OverflowError):
         return None, 0
     
+    if safe_evaluation and np.sign(f_prev) * np.sign(f_curr) < 0:
+        return safeguarded_secant(f, a, b, f_prev, f_curr, epsilon, iterations,
+                                  use_epsilon_condition)
+    
     while i < iterations:
+        if safe_evaluation and is_out_of_scale(f_prev, f_curr):
+            if not np.isfinite(f_prev) and not np.isfinite(f_curr):
+                return None, i
+            
+            # Krok siecznej przez takie punkty trafia w punkt o mniejszej wartości,
+            # więc punkt o większej wartości przesuwany jest w połowę drogi do drugiego
+            x_mid = (x_prev + x_curr) / 2
+            try:
+                f_mid = f(x_mid)
+            except (ValueError, OverflowError):
+                return None, i
+            
+            if abs(f_mid) < epsilon:
+                return x_mid, i + 1
+            
+            if abs(f_prev) > abs(f_curr):
+                x_prev, f_prev = x_mid, f_mid
+            else:
+                x_curr, f_curr = x_mid, f_mid
+            i += 1
+            continue
+        
         try:
             denominator = f_curr - f_prev
             if abs(denominator) < 1e-10:
@@ -61,6 +171,10 @@ def secant_method(f, a, b, epsilon, iterations, use_epsilon_condition):
         except (ValueError, OverflowError):
             return None, i
         
+        # Krok utracony w zaokrągleniach to nie pierwiastek, jeśli |f| nie jest małe
+        if safe_evaluation and x_next == x_curr and abs(f_next) >= epsilon:
+            return None, i + 1
+        
         if use_epsilon_condition and abs(x_next - x_curr) < epsilon:
             return x_next, i + 1
         
@@ -147,6 +261,12 @@ def apply_trigonometric(x, trig_type, a, b, c, d):
 def apply_exponential(x, exp_type, a, b, c, p=None):
     if exp_type == 1:
         return a * np.exp(b * x) + c
+    elif p > 0:
+        if a == 0:
+            return c
+        # Potęga w float64 - przepełnienie daje ±inf zamiast OverflowError
+        with np.errstate(over='ignore'):
+            return a * (np.float64(p) ** (b * x)) + c
     else:
         return a * (p ** (b * x)) + c
 
@@ -267,14 +387,19 @@ def main():
 
     a, b, epsilon, iterations, use_epsilon_condition = get_user_input()
     
+    print("\nWybierz tryb obliczania wartości funkcji:")
+    print("1. Standardowy")
+    print("2. Odporny na przepełnienie (znak / rozszerzona precyzja)")
+    safe_evaluation = int(input("Podaj wybór (1-2): ")) == 2
+    
     print("\nStosowanie metody bisekcji...")
     root_bisection, iters_bisection = bisection_method(
-        composite_function, a, b, epsilon, iterations, use_epsilon_condition
+        composite_function, a, b, epsilon, iterations, use_epsilon_condition, safe_evaluation
     )
     
     print("\nStosowanie metody siecznych...")
     root_secant, iters_secant = secant_method(
-        composite_function, a, b, epsilon, iterations, use_epsilon_condition
+        composite_function, a, b, epsilon, iterations, use_epsilon_condition, safe_evaluation
     )
     
     print("\nWyniki:")
@@ -292,6 +417,8 @@ def main():
         'bisekcja': root_bisection,
         'sieczna': root_secant
     }
+    if safe_evaluation:
+        composite_function = create_safe_function(composite_function)
     if any(root is not None for root in roots_dict.values()):
         plot_function_and_roots(composite_function, roots_dict, a, b, 
                               "Funkcja i jej pierwiastki (Metody bisekcji i siecznych)")
@@ -0,0 +1,184 @@
+import os
+import sys
+import time
+import numpy as np
+
+# Katalog główny repozytorium, aby zaimportować solver układów liniowych
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linear_equations_solver.main import gaussian_elimination, lu_decomposition, lu_solve
+
+def finite_difference_jacobian(F, x, fx=None, vectorized=False):
+    n = len(x)
+    if fx is None:
+        fx = np.asarray(F(x), dtype=float)
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1.0)
+
+    # Kolumna j macierzy X to punkt x przesunięty o h_j w kierunku j
+    X = x[:, None] + np.diag(h)
+    FX = None
+    if vectorized:
+        # Wynik wywołania wsadowego musi zgadzać się z wywołaniem dla pojedynczego punktu,
+        # a F, która nie obsługuje macierzy punktów, liczona jest kolumna po kolumnie
+        try:
+            FX = np.asarray(F(X), dtype=float)
+            if FX.shape != (n, n) or not np.allclose(FX[:, 0], F(X[:, 0]), rtol=1e-12, atol=0):
+                FX = None
+        except (ValueError, TypeError, IndexError):
+            FX = None
+    if FX is None:
+        FX = np.column_stack([F(X[:, j]) for j in range(n)])
+
+    return (FX - fx[:, None]) / h
+
+def evaluate_jacobian(F, x, fx, jacobian, vectorized):
+    if jacobian is not None:
+        return np.asarray(jacobian(x), dtype=float)
+    return finite_difference_jacobian(F, x, fx, vectorized)
+
+def newton_system(F, x0, epsilon, iterations, jacobian=None, vectorized=False):
+    x = np.array(x0, dtype=float)
+    fx = np.asarray(F(x), dtype=float)
+
+    for i in range(iterations):
+        J = evaluate_jacobian(F, x, fx, jacobian, vectorized)
+        dx, error = gaussian_elimination(J, -fx)
+        if error:
+            return None, i, f"Macierz Jacobiego: {error}"
+
+        x = x + dx
+        fx = np.asarray(F(x), dtype=float)
+        if not np.all(np.isfinite(fx)):
+            return None, i + 1, "Wartości funkcji wyszły poza zakres"
+
+        if np.linalg.norm(dx) < epsilon or np.linalg.norm(fx) < epsilon:
+            return x, i + 1, None
+
+    return None, iterations, "Nie osiągnięto zbieżności"
+
+def broyden_system(F, x0, epsilon, iterations, jacobian=None, vectorized=False):
+    x = np.array(x0, dtype=float)
+    fx = np.asarray(F(x), dtype=float)
+    H = None
+
+    for i in range(iterations):
+        if H is None:
+            # Rozkład LU tylko przy starcie i przy odświeżeniu Jacobianu
+            J = evaluate_jacobian(F, x, fx, jacobian, vectorized)
+            LU, perm, error = lu_decomposition(J)
+            if error:
+                return None, i, f"Macierz Jacobiego: {error}"
+            H = lu_solve(LU, perm, np.eye(len(x)))
+
+        dx = -H @ fx
+        x_new = x + dx
+        f_new = np.asarray(F(x_new), dtype=float)
+        if not np.all(np.isfinite(f_new)):
+            return None, i + 1, "Wartości funkcji wyszły poza zakres"
+
+        if np.linalg.norm(dx) < epsilon or np.linalg.norm(f_new) < epsilon:
+            return x_new, i + 1, None
+
+        # Aktualizacja rzędu 1 odwrotności Jacobianu (wzór Shermana-Morrisona)
+        y = f_new - fx
+        Hy = H @ y
+        denominator = dx @ Hy
+        if np.linalg.norm(f_new) >= np.linalg.norm(fx) or abs(denominator) < 1e-14:
+            H = None
+        else:
+            H += np.outer(dx - Hy, dx @ H) / denominator
+
+        x, fx = x_new, f_new
+
+    return None, iterations, "Nie osiągnięto zbieżności"
+
+def broyden_tridiagonal(x):
+    # Działa dla wektora (n,) i dla macierzy (n, k) z punktami w kolumnach
+    x = np.asarray(x, dtype=float)
+    prev = np.zeros_like(x)
+    prev[1:] = x[:-1]
+    following = np.zeros_like(x)
+    following[:-1] = x[1:]
+    return (3 - 2*x)*x - prev - 2*following + 1
+
+def broyden_tridiagonal_jacobian(x):
+    n = len(x)
+    return (np.diag(3 - 4*x) - np.diag(np.ones(n - 1), -1)
+            - 2*np.diag(np.ones(n - 1), 1))
+
+def get_example_systems(n=10):
+    systems = [
+        (
+            lambda x: np.array([x[0]**2 + x[1]**2 - 4,
+                                np.exp(x[0]) + x[1] - 1]),
+            lambda x: np.array([[2*x[0], 2*x[1]],
+                                [np.exp(x[0]), 1]]),
+            [1.0, -1.0]
+        ),
+        (
+            lambda x: np.array([3*x[0] - np.cos(x[1]*x[2]) - 0.5,
+                                x[0]**2 - 81*(x[1] + 0.1)**2 + np.sin(x[2]) + 1.06,
+                                np.exp(-x[0]*x[1]) + 20*x[2] + (10*np.pi - 3) / 3]),
+            lambda x: np.array([[3, x[2]*np.sin(x[1]*x[2]), x[1]*np.sin(x[1]*x[2])],
+                                [2*x[0], -162*(x[1] + 0.1), np.cos(x[2])],
+                                [-x[1]*np.exp(-x[0]*x[1]), -x[0]*np.exp(-x[0]*x[1]), 20]]),
+            [0.1, 0.1, -0.1]
+        ),
+        (
+            broyden_tridiagonal,
+            broyden_tridiagonal_jacobian,
+            -np.ones(n)
+        )
+    ]
+    return systems
+
+def print_results(name, solution, iters, error, elapsed, F):
+    print(f"\n{name}:")
+    if error:
+        print(f"Nie udało się znaleźć rozwiązania: {error}")
+        return
+    for i, xi in enumerate(solution):
+        print(f"x{i+1} = {xi:.10f}")
+    print(f"Liczba iteracji = {iters}")
+    print(f"Norma residuum ||F(x)|| = {np.linalg.norm(F(solution)):.3e}")
+    print(f"Czas = {elapsed:.4f} s")
+
+def main():
+    print("\nRozwiązywanie układów równań nieliniowych F(x) = 0")
+    print("\nDostępne układy przykładowe:")
+    print("1. x² + y² - 4 = 0, e^x + y - 1 = 0")
+    print("2. 3x - cos(yz) - 1/2 = 0, x² - 81(y + 0.1)² + sin(z) + 1.06 = 0, e^(-xy) + 20z + (10π - 3)/3 = 0")
+    print("3. Trójdiagonalny układ Broydena (3 - 2x_i)x_i - x_(i-1) - 2x_(i+1) + 1 = 0")
+    system_choice = int(input("Wybierz układ (1-3): ")) - 1
+
+    n = 10
+    if system_choice == 2:
+        n = int(input("Podaj liczbę równań: "))
+    F, J, x0 = get_example_systems(n)[system_choice]
+
+    print("\nWybierz sposób wyznaczania macierzy Jacobiego:")
+    print("1. Analitycznie")
+    print("2. Ilorazy różnicowe")
+    jacobian = J if int(input("Podaj wybór (1-2): ")) == 1 else None
+
+    epsilon = float(input("\nPodaj wartość ε: "))
+    iterations = int(input("Podaj maksymalną liczbę iteracji: "))
+
+    print("\nStosowanie metody Newtona...")
+    start = time.perf_counter()
+    solution_newton, iters_newton, error_newton = newton_system(F, x0, epsilon, iterations, jacobian,
+                                                             vectorized=True)
+    elapsed_newton = time.perf_counter() - start
+
+    print("\nStosowanie metody Broydena...")
+    start = time.perf_counter()
+    solution_broyden, iters_broyden, error_broyden = broyden_system(F, x0, epsilon, iterations, jacobian,
+                                                                 vectorized=True)
+    elapsed_broyden = time.perf_counter() - start
+
+    print("\nWyniki:")
+    print_results("Metoda Newtona", solution_newton, iters_newton, error_newton, elapsed_newton, F)
+    print_results("Metoda Broydena", solution_broyden, iters_broyden, error_broyden, elapsed_broyden, F)
+
+if __name__ == "__main__":
+    main()